@@ -0,0 +1,35 @@
+"""
+Optional Numba-accelerated kernels for farm-scale batch sweeps.
+
+decide_batch_kernel classifies a vector of moisture readings against per-field
+thresholds in one pass. The emitted code is the band index used by the
+threshold tables in irrigation_agent (0 = below min, 1 = below optimal,
+2 = within range, 3 = above max), so callers map codes straight back to
+IrrigationDecision and reason templates.
+
+When numba is not installed the pure-Python loop below is used instead, so
+this module never becomes a hard dependency.
+"""
+
+
+def _decide_batch_py(moisture, mn, mx, opt, out):
+    for i in range(moisture.shape[0]):
+        m = moisture[i]
+        out[i] = 0 if m < mn[i] else (3 if m > mx[i] else (1 if m < opt[i] else 2))
+
+
+try:
+    from numba import njit, prange
+
+    # cache=True persists the compiled kernel on disk, avoiding the
+    # 50-200 ms cold-start recompile on every interpreter restart.
+    @njit(parallel=True, cache=True)
+    def decide_batch_kernel(moisture, mn, mx, opt, out):  # pragma: no cover - needs numba
+        for i in prange(moisture.shape[0]):
+            m = moisture[i]
+            out[i] = 0 if m < mn[i] else (3 if m > mx[i] else (1 if m < opt[i] else 2))
+
+    HAS_NUMBA = True
+except ImportError:
+    decide_batch_kernel = _decide_batch_py
+    HAS_NUMBA = False
@@ -6,156 +6,197 @@ Covers:
 - Field not found          → MAINTENANCE_REQUIRED + LLM still runs
 - Sensor timeout + retry   → MAINTENANCE_REQUIRED + LLM still runs
 - Hardware error           → MAINTENANCE_REQUIRED + LLM still runs
-- Multi-field validation
+- Multi-field validation (parametrized + batched decide_many)
 - LLM fields present on success
 - LLM fields present on failure
+
+Run with `pytest test_agent.py` (or `python test_agent.py`, which delegates).
 """
 
-from irrigation_agent import IrrigationAgent, IrrigationDecision, MockSensorNetwork
-
-
-class TestRunner:
-    def __init__(self):
-        self.agent = IrrigationAgent(max_sensor_retries=3)
-        self.results = []
-        self.failures = []
-
-    def run_all(self):
-        tests = [
-            self.test_normal_operation,
-            self.test_field_not_found,
-            self.test_sensor_timeout,
-            self.test_hardware_error,
-            self.test_multiple_fields,
-            self.test_llm_on_success,
-            self.test_llm_on_sensor_failure,
-            self.test_llm_on_field_not_found,
-        ]
-        for test in tests:
-            try:
-                test()
-            except AssertionError as e:
-                name = test.__name__.replace("test_", "").replace("_", " ").title()
-                self.failures.append((name, str(e)))
-        self.summary()
-
-    # ------------------------------------------------------------------
-    def test_normal_operation(self):
-        original = MockSensorNetwork.get_soil_moisture
-        MockSensorNetwork.get_soil_moisture = staticmethod(
-            lambda fid: {1: 28.5, 2: 45.2, 12: 32.1, 15: 35.8, 20: 55.3}.get(fid, 40.0)
-        )
-        try:
-            result = self.agent.decide_json(12)
-            assert result["decision"] in [d.value for d in IrrigationDecision]
-            assert result["current_moisture"] is not None
-            assert result["optimal_range"] is not None
-            self.results.append("Normal Operation")
-        finally:
-            MockSensorNetwork.get_soil_moisture = original
-
-    # ------------------------------------------------------------------
-    def test_field_not_found(self):
-        result = self.agent.decide_json(999)
-        assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
-        assert len(result["errors"]) > 0
-        self.results.append("Field Not Found")
-
-    # ------------------------------------------------------------------
-    def test_sensor_timeout(self):
-        original = MockSensorNetwork.get_soil_moisture
-        MockSensorNetwork.get_soil_moisture = staticmethod(lambda fid: None)
-        try:
-            result = self.agent.decide_json(12)
-            assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
-            assert result["sensor_attempts"] >= 3
-            self.results.append("Sensor Timeout + Retry")
-        finally:
-            MockSensorNetwork.get_soil_moisture = original
-
-    # ------------------------------------------------------------------
-    def test_hardware_error(self):
-        original = MockSensorNetwork.get_soil_moisture
-        MockSensorNetwork.get_soil_moisture = staticmethod(lambda fid: -50.0)
-        try:
-            result = self.agent.decide_json(12)
-            assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
-            assert any("error" in e.lower() or "impossible" in e.lower() for e in result["errors"]), \
-                f"No descriptive error. errors={result['errors']}"
-            self.results.append("Hardware Error")
-        finally:
-            MockSensorNetwork.get_soil_moisture = original
-
-    # ------------------------------------------------------------------
-    def test_multiple_fields(self):
-        original = MockSensorNetwork.get_soil_moisture
-        MockSensorNetwork.get_soil_moisture = staticmethod(
-            lambda fid: {1: 28.5, 2: 45.2, 12: 32.1, 15: 35.8, 20: 55.3}.get(fid, 40.0)
-        )
-        try:
-            for fid in [1, 2, 12, 15, 20]:
-                result = self.agent.decide_json(fid)
-                assert result["decision"] in [d.value for d in IrrigationDecision]
-            self.results.append("Multiple Fields")
-        finally:
-            MockSensorNetwork.get_soil_moisture = original
-
-    # ------------------------------------------------------------------
-    def test_llm_on_success(self):
-        original = MockSensorNetwork.get_soil_moisture
-        MockSensorNetwork.get_soil_moisture = staticmethod(lambda fid: 32.1)
-        try:
-            result = self.agent.decide_json(12)
-            assert result["decision"] in [d.value for d in IrrigationDecision]
-            self._assert_llm_fields(result, context="success path")
-            self.results.append("LLM on Success")
-        finally:
-            MockSensorNetwork.get_soil_moisture = original
-
-    # ------------------------------------------------------------------
-    def test_llm_on_sensor_failure(self):
-        original = MockSensorNetwork.get_soil_moisture
-        MockSensorNetwork.get_soil_moisture = staticmethod(lambda fid: None)
-        try:
-            result = self.agent.decide_json(12)
-            assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
-            self._assert_llm_fields(result, context="sensor failure path")
-            self.results.append("LLM on Sensor Failure")
-        finally:
-            MockSensorNetwork.get_soil_moisture = original
-
-    # ------------------------------------------------------------------
-    def test_llm_on_field_not_found(self):
-        result = self.agent.decide_json(999)
-        assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
-        self._assert_llm_fields(result, context="field not found path")
-        self.results.append("LLM on Field Not Found")
-
-    # ------------------------------------------------------------------
-    def _assert_llm_fields(self, result: dict, context: str = ""):
-        prefix = f"[{context}] " if context else ""
-        assert result.get("llm_consensus"), f"{prefix}llm_consensus should be non-empty"
-        assert result.get("llm_recommendation"), f"{prefix}llm_recommendation should be non-empty"
-        assert isinstance(result.get("llm_providers_used"), list) and result["llm_providers_used"], \
-            f"{prefix}llm_providers_used should be a non-empty list"
-        assert isinstance(result.get("llm_results"), list) and result["llm_results"], \
-            f"{prefix}llm_results should be a non-empty list"
-
-    # ------------------------------------------------------------------
-    def summary(self):
-        print("\nTest Summary")
-        print("=" * 55)
-        for test in self.results:
-            print(f"  ✓ {test}: PASS")
-        for name, err in self.failures:
-            print(f"  ✗ {name}: FAIL — {err}")
-        print("-" * 55)
-        print(f"Passed: {len(self.results)} / {len(self.results) + len(self.failures)}")
-        if self.failures:
-            raise SystemExit(1)
-        print("All tests passed.")
+import time
+import random
+import asyncio
+
+import pytest
+
+import irrigation_agent
+from irrigation_agent import DECISION_VALUES, IrrigationAgent, IrrigationDecision, MockSensorNetwork
+
+FIELD_READINGS = {1: 28.5, 2: 45.2, 12: 32.1, 15: 35.8, 20: 55.3}
+
+
+@pytest.fixture(autouse=True)
+def _seeded_rng():
+    # Reproducible sensor randomness for any path that isn't monkeypatched.
+    # This covers probe draws on LangGraph executor threads too: _thread_rng
+    # seeds worker generators from the main generator, so they derive from
+    # this seed.
+    random.seed(42)
+
+
+@pytest.fixture
+def agent():
+    return IrrigationAgent(max_sensor_retries=3)
+
+
+def _patch_sensor(monkeypatch, fn):
+    monkeypatch.setattr(MockSensorNetwork, "get_soil_moisture", staticmethod(fn))
+
+
+# ----------------------------------------------------------------------
+def test_normal_operation(agent, monkeypatch):
+    _patch_sensor(monkeypatch, lambda fid: FIELD_READINGS.get(fid, 40.0))
+    result = agent.decide_json(12)
+    assert result["decision"] in DECISION_VALUES
+    assert result["current_moisture"] is not None
+    assert result["optimal_range"] is not None
+
+
+# ----------------------------------------------------------------------
+def test_field_not_found(agent):
+    result = agent.decide_json(999)
+    assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
+    assert len(result["errors"]) > 0
+
+
+# ----------------------------------------------------------------------
+def test_sensor_timeout(agent, monkeypatch):
+    _patch_sensor(monkeypatch, lambda fid: None)
+    result = agent.decide_json(12)
+    assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
+    assert result["sensor_attempts"] >= 3
+
+
+# ----------------------------------------------------------------------
+def test_hardware_error(agent, monkeypatch):
+    _patch_sensor(monkeypatch, lambda fid: -50.0)
+    result = agent.decide_json(12)
+    assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
+    assert any("error" in e.lower() or "impossible" in e.lower() for e in result["errors"]), \
+        f"No descriptive error. errors={result['errors']}"
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("field_id", [1, 2, 12, 15, 20])
+def test_known_field(agent, monkeypatch, field_id):
+    _patch_sensor(monkeypatch, lambda fid: FIELD_READINGS.get(fid, 40.0))
+    result = agent.decide_json(field_id)
+    assert result["decision"] in DECISION_VALUES
+
+
+# ----------------------------------------------------------------------
+def test_decide_many(agent, monkeypatch):
+    _patch_sensor(monkeypatch, lambda fid: FIELD_READINGS.get(fid, 40.0))
+    field_ids = [1, 2, 12, 15, 20]
+    outputs = agent.decide_many(field_ids)
+    assert [o.field_id for o in outputs] == field_ids
+    for output in outputs:
+        assert output.decision in IrrigationDecision
+
+
+# ----------------------------------------------------------------------
+def test_adecide_many(agent, monkeypatch):
+    # The async graph reads through _read_once (aget_soil_moisture awaits the
+    # link latency itself), so that's the seam to stub.
+    monkeypatch.setattr(MockSensorNetwork, "CACHE_TTL_S", 0.0)
+    monkeypatch.setattr(MockSensorNetwork, "_read_once", staticmethod(lambda fid: FIELD_READINGS.get(fid)))
+    field_ids = [1, 12, 999]
+    outputs = asyncio.run(agent.adecide_many(field_ids))
+    assert [o.field_id for o in outputs] == field_ids
+    assert outputs[0].decision in IrrigationDecision
+    assert outputs[1].decision in IrrigationDecision
+    assert outputs[2].decision == IrrigationDecision.MAINTENANCE_REQUIRED
+
+
+# ----------------------------------------------------------------------
+def test_sensor_cache(monkeypatch):
+    monkeypatch.setattr(MockSensorNetwork, "_CACHE", {})
+    monkeypatch.setattr(MockSensorNetwork, "CACHE_TTL_S", 60.0)
+    reads = {"n": 0}
+
+    def read_once(fid):
+        reads["n"] += 1
+        return 32.1
+
+    monkeypatch.setattr(MockSensorNetwork, "_read_once", staticmethod(read_once))
+
+    assert MockSensorNetwork.get_soil_moisture(12) == 32.1
+    assert MockSensorNetwork.get_soil_moisture(12) == 32.1
+    assert reads["n"] == 1, "second read within TTL should be a cache hit"
+
+    MockSensorNetwork.invalidate(12)
+    assert MockSensorNetwork.get_soil_moisture(12) == 32.1
+    assert reads["n"] == 2, "invalidate should force a fresh read"
+
+    monkeypatch.setattr(MockSensorNetwork, "CACHE_TTL_S", 0.05)
+    MockSensorNetwork.invalidate()
+    MockSensorNetwork.get_soil_moisture(12)
+    time.sleep(0.06)
+    MockSensorNetwork.get_soil_moisture(12)
+    assert reads["n"] == 4, "expired entry should be re-read"
+
+    # Invalid readings are never cached.
+    monkeypatch.setattr(MockSensorNetwork, "_read_once", staticmethod(lambda fid: -50.0))
+    MockSensorNetwork.invalidate()
+    assert MockSensorNetwork.get_soil_moisture(12) == -50.0
+    assert MockSensorNetwork.get_soil_moisture(12) == -50.0
+    assert 12 not in MockSensorNetwork._CACHE
+
+
+# ----------------------------------------------------------------------
+def test_decision_cache(monkeypatch):
+    monkeypatch.setattr(irrigation_agent, "_DECISION_CACHE_ENABLED", True)
+    cached_agent = IrrigationAgent(max_sensor_retries=3)
+    _patch_sensor(monkeypatch, lambda fid: 32.1)
+
+    first = cached_agent.decide_json(12)
+    hit = cached_agent.decide_json(12)
+    assert hit == first and hit is not first, "hits return an equal defensive copy"
+
+    hit["errors"].append("caller mutation")
+    assert cached_agent.decide_json(12)["errors"] == [], "mutating a hit must not corrupt the cache"
+
+    # Maintenance outcomes are never cached.
+    _patch_sensor(monkeypatch, lambda fid: None)
+    cached_agent._decision_cache.clear()
+    failure = cached_agent.decide_json(12)
+    assert failure["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
+    assert cached_agent._decision_cache.get(12) is None
+
+
+# ----------------------------------------------------------------------
+def test_llm_on_success(agent, monkeypatch):
+    _patch_sensor(monkeypatch, lambda fid: 32.1)
+    result = agent.decide_json(12)
+    assert result["decision"] in DECISION_VALUES
+    _assert_llm_fields(result, context="success path")
+
+
+# ----------------------------------------------------------------------
+def test_llm_on_sensor_failure(agent, monkeypatch):
+    _patch_sensor(monkeypatch, lambda fid: None)
+    result = agent.decide_json(12)
+    assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
+    _assert_llm_fields(result, context="sensor failure path")
+
+
+# ----------------------------------------------------------------------
+def test_llm_on_field_not_found(agent):
+    result = agent.decide_json(999)
+    assert result["decision"] == IrrigationDecision.MAINTENANCE_REQUIRED.value
+    _assert_llm_fields(result, context="field not found path")
+
+
+# ----------------------------------------------------------------------
+def _assert_llm_fields(result: dict, context: str = ""):
+    prefix = f"[{context}] " if context else ""
+    assert result.get("llm_consensus"), f"{prefix}llm_consensus should be non-empty"
+    assert result.get("llm_recommendation"), f"{prefix}llm_recommendation should be non-empty"
+    assert isinstance(result.get("llm_providers_used"), list) and result["llm_providers_used"], \
+        f"{prefix}llm_providers_used should be a non-empty list"
+    assert isinstance(result.get("llm_results"), list) and result["llm_results"], \
+        f"{prefix}llm_results should be a non-empty list"
 
 
 if __name__ == "__main__":
-    runner = TestRunner()
-    runner.run_all()
+    raise SystemExit(pytest.main([__file__, "-q"]))